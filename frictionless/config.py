@@ -70,6 +70,9 @@ DEFAULT_GROUP_CHAR = ""
 DEFAULT_DECIMAL_CHAR = "."
 DEFAULT_SERVER_PORT = 8000
 DEFAULT_HTTP_TIMEOUT = 10
+DEFAULT_HTTP_BUFFER_SIZE = 1024 * 1024
+DEFAULT_HTTP_POOL_CONNECTIONS = 20
+DEFAULT_HTTP_POOL_MAXSIZE = 100
 DEFAULT_HTTP_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_11_6) "
@@ -172,7 +172,9 @@ class Header(list):
                     )
 
         # Iterate items
+        # Positions of the seen labels are tracked to find duplicates in a single pass
         field_number = 0
+        seen_field_positions = {}
         for field_position, field, label in zip(field_positions, fields, labels):
             field_number += 1
 
@@ -192,12 +194,8 @@ class Header(list):
 
             # Duplicated label
             if label:
-                duplicate_field_positions = []
-                seen_cells = labels[0 : field_number - 1]
-                seen_field_positions = field_positions[0 : field_number - 1]
-                for seen_position, seen_cell in zip(seen_field_positions, seen_cells):
-                    if label == seen_cell:
-                        duplicate_field_positions.append(seen_position)
+                duplicate_field_positions = list(seen_field_positions.get(label, []))
+                seen_field_positions.setdefault(label, []).append(field_position)
                 if duplicate_field_positions:
                     label = None
                     note = 'at position "%s"'
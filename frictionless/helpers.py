@@ -48,6 +48,10 @@ def get_name(value):
     return getattr(value, "__name__", value.__class__.__name__)
 
 
+def get_pool_size(tasks_count):
+    return max(1, min(tasks_count, os.cpu_count() or 1))
+
+
 def pass_through(iterator):
     for item in iterator:
         pass
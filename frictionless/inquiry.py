@@ -53,8 +53,9 @@ class Inquiry(Metadata):
 
         # Validate in-parallel
         else:
-            with Pool() as pool:
-                task_descriptors = [task.to_dict() for task in self.tasks]
+            task_descriptors = [task.to_dict() for task in self.tasks]
+            processes = helpers.get_pool_size(len(task_descriptors))
+            with Pool(processes) as pool:
                 report_descriptors = pool.map(run_task_in_parallel, task_descriptors)
                 for report_descriptor in report_descriptors:
                     reports.append(Report(report_descriptor))
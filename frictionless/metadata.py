@@ -1,12 +1,11 @@
 import io
 import json
 import yaml
-import requests
 import jsonschema
 import stringcase
 from pathlib import Path
 from operator import setitem
-from functools import partial
+from functools import partial, lru_cache
 from importlib import import_module
 from .exception import FrictionlessException
 from .helpers import cached_property
@@ -67,9 +66,8 @@ class Metadata(helpers.ControlledDict):
     def __onchange__(self, onchange=None):
         super().__onchange__(onchange)
         if hasattr(self, "_Metadata__Error"):
-            for key, attr in type(self).__dict__.items():
-                reset = getattr(attr, "metadata_reset", None)
-                if reset and key in self.__dict__:
+            for key in metadata_reset_keys(type(self)):
+                if key in self.__dict__:
                     self.__dict__.pop(key)
             self.metadata_process()
 
@@ -203,7 +201,8 @@ class Metadata(helpers.ControlledDict):
                 if isinstance(descriptor, Path):
                     descriptor = str(descriptor)
                 if helpers.is_remote_path(descriptor):
-                    response = requests.get(descriptor)
+                    system = import_module("frictionless.system").system
+                    response = system.get_http_session().get(descriptor)
                     response.raise_for_status()
                     content = response.text
                 else:
@@ -287,6 +286,20 @@ def metadata_to_dict(value):
     return value
 
 
+# NOTE:
+# Metadata changes are very frequent (every setitem triggers onchange)
+# so we resolve resettable properties once per class instead of every time
+
+
+@lru_cache(maxsize=None)
+def metadata_reset_keys(Class):
+    keys = []
+    for key, attr in Class.__dict__.items():
+        if getattr(attr, "metadata_reset", None):
+            keys.append(key)
+    return keys
+
+
 def metadata_attach(self, name, value):
     # Using standalone `setitem` without a wrapper doesn't work for Python3.6
     return setitem(self, name, value)
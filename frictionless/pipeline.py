@@ -55,8 +55,9 @@ class Pipeline(Metadata):
 
         # Transform in-parallel
         else:
-            with Pool() as pool:
-                task_descriptors = [task.to_dict() for task in self.tasks]
+            task_descriptors = [task.to_dict() for task in self.tasks]
+            processes = helpers.get_pool_size(len(task_descriptors))
+            with Pool(processes) as pool:
                 status_descriptors = pool.map(run_task_in_parallel, task_descriptors)
                 for status_descriptor in status_descriptors:
                     statuses.append(Status(status_descriptor))
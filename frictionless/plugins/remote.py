@@ -4,6 +4,7 @@ from ..metadata import Metadata
 from ..control import Control
 from ..plugin import Plugin
 from ..loader import Loader
+from ..system import system
 from .. import config
 
 
@@ -45,6 +46,7 @@ class RemoteControl(Control):
         http_session? (requests.Session): user defined HTTP session
         http_preload? (bool): don't use HTTP streaming and preload all the data
         http_timeout? (int): user defined HTTP timeout in minutes
+        http_buffer_size? (int): size of the buffer for reading HTTP responses in bytes
 
     Raises:
         FrictionlessException: raise any error that occurs during the process
@@ -58,10 +60,12 @@ class RemoteControl(Control):
         http_session=None,
         http_preload=None,
         http_timeout=None,
+        http_buffer_size=None,
     ):
         self.setinitial("httpSession", http_session)
         self.setinitial("httpPreload", http_preload)
         self.setinitial("httpTimeout", http_timeout)
+        self.setinitial("httpBufferSize", http_buffer_size)
         super().__init__(descriptor)
 
     @Metadata.property
@@ -72,8 +76,7 @@ class RemoteControl(Control):
         """
         http_session = self.get("httpSession")
         if not http_session:
-            http_session = requests.Session()
-            http_session.headers.update(config.DEFAULT_HTTP_HEADERS)
+            http_session = system.get_http_session()
         return http_session
 
     @Metadata.property
@@ -92,12 +95,21 @@ class RemoteControl(Control):
         """
         return self.get("httpTimeout", config.DEFAULT_HTTP_TIMEOUT)
 
+    @Metadata.property
+    def http_buffer_size(self):
+        """
+        Returns:
+            int: HTTP buffer size in bytes
+        """
+        return self.get("httpBufferSize", config.DEFAULT_HTTP_BUFFER_SIZE)
+
     # Expand
 
     def expand(self):
         """Expand metadata"""
         self.setdefault("httpPreload", self.http_preload)
         self.setdefault("httpTimeout", self.http_timeout)
+        self.setdefault("httpBufferSize", self.http_buffer_size)
 
     # Metadata
 
@@ -108,6 +120,7 @@ class RemoteControl(Control):
             "httpSession": {},
             "httpPreload": {"type": "boolean"},
             "httpTimeout": {"type": "number"},
+            "httpBufferSize": {"type": "integer", "minimum": 1},
         },
     }
 
@@ -132,7 +145,10 @@ class RemoteLoader(Loader):
         fullpath = requests.utils.requote_uri(self.resource.fullpath)
         session = self.resource.control.http_session
         timeout = self.resource.control.http_timeout
+        buffer_size = self.resource.control.http_buffer_size
         byte_stream = RemoteByteStream(fullpath, session=session, timeout=timeout).open()
+        # Large buffered reads cut the number of network reads for big files
+        byte_stream = io.BufferedReader(byte_stream, buffer_size=buffer_size)
         if self.resource.control.http_preload:
             buffer = io.BufferedRandom(io.BytesIO())
             buffer.write(byte_stream.read())
@@ -201,6 +217,14 @@ class RemoteByteStream:
     def read1(self, size=-1):
         return self.read(size)
 
+    def readinto(self, buffer):
+        # NOTE: decoded content can be longer than requested so we keep the rest
+        chunk = self.__remainder or self.read(len(buffer))
+        self.__remainder = chunk[len(buffer) :]
+        chunk = chunk[: len(buffer)]
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
     def seek(self, offset, whence=0):
         assert offset == 0
         assert whence == 0
@@ -209,3 +233,5 @@ class RemoteByteStream:
         )
         self.__response.raise_for_status()
         self.__response.raw.decode_content = True
+        self.__remainder = b""
+        return 0
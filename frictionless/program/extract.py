@@ -9,6 +9,7 @@ from ..extract import extract
 from ..layout import Layout
 from .main import program
 from .. import helpers
+from .. import config
 from . import common
 
 
@@ -145,22 +146,30 @@ def program_extract(
     )
 
     # Extract data
+    # JSON and CSV outputs are written row by row without loading the data
     try:
         process = (lambda row: row.to_dict(json=True)) if json or yaml else None
-        data = extract(source, process=process, **options)
+        data = extract(source, process=process, stream=True, **options)
+        if not json and not csv:
+            data = materialize_data(data)
     except Exception as exception:
         typer.secho(str(exception), err=True, fg=typer.colors.RED, bold=True)
         raise typer.Exit(1)
 
     # Normalize data
     normdata = data
-    if isinstance(data, list):
+    if not isinstance(data, dict):
         normdata = {source: data}
 
     # Return JSON
     if json:
-        content = pyjson.dumps(data, indent=2, ensure_ascii=False)
-        typer.secho(content)
+        try:
+            for chunk in stream_json_data(data):
+                typer.secho(chunk, nl=False)
+        except Exception as exception:
+            typer.secho(str(exception), err=True, fg=typer.colors.RED, bold=True)
+            raise typer.Exit(1)
+        typer.secho("")
         raise typer.Exit()
 
     # Return YAML
@@ -171,13 +180,17 @@ def program_extract(
 
     # Return CSV
     if csv:
-        for number, rows in enumerate(normdata.values(), start=1):
-            for row in rows:
-                if row.row_number == 1:
-                    typer.secho(helpers.stringify_csv_string(row.field_names))
-                typer.secho(row.to_str())
-            if number < len(normdata):
-                typer.secho("")
+        try:
+            for number, rows in enumerate(normdata.values(), start=1):
+                for row in rows:
+                    if row.row_number == 1:
+                        typer.secho(helpers.stringify_csv_string(row.field_names))
+                    typer.secho(row.to_str())
+                if number < len(normdata):
+                    typer.secho("")
+        except Exception as exception:
+            typer.secho(str(exception), err=True, fg=typer.colors.RED, bold=True)
+            raise typer.Exit(1)
         raise typer.Exit()
 
     # Return default
@@ -193,3 +206,47 @@ def program_extract(
         typer.secho(str(petl.util.vis.lookall(subdata, vrepr=str, style="simple")))
         if number < len(normdata):
             typer.secho("")
+
+
+# Internal
+
+
+def materialize_data(data):
+    if isinstance(data, dict):
+        return {name: list(rows) for name, rows in data.items()}
+    return list(data)
+
+
+def stream_json_data(data, *, level=0):
+    indent = "  " * level
+    if isinstance(data, dict):
+        items = iter(data.items())
+        item = next(items, None)
+        if item is None:
+            yield "{}"
+            return
+        yield "{"
+        while item is not None:
+            name, rows = item
+            key = pyjson.dumps(name, ensure_ascii=False)
+            yield f"\n{indent}  {key}: "
+            yield from stream_json_data(rows, level=level + 1)
+            item = next(items, None)
+            if item is not None:
+                yield ","
+        yield f"\n{indent}}}"
+        return
+    # The first row is read before writing anything to report source errors early
+    rows = iter(data)
+    row = next(rows, config.UNDEFINED)
+    if row is config.UNDEFINED:
+        yield "[]"
+        return
+    # The encoder is reused as json.dumps creates a new one on every call with options
+    encoder = pyjson.JSONEncoder(indent=2, ensure_ascii=False)
+    yield "["
+    while row is not config.UNDEFINED:
+        text = f"\n{indent}  " + encoder.encode(row).replace("\n", f"\n{indent}  ")
+        row = next(rows, config.UNDEFINED)
+        yield text + ("," if row is not config.UNDEFINED else "")
+    yield f"\n{indent}]"
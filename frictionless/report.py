@@ -127,14 +127,12 @@ class Report(Metadata):
         """
         result = []
         for error in self.errors:
-            context = {}
-            context.update(error)
-            result.append([context.get(prop) for prop in spec])
+            result.append([error.get(prop) for prop in spec])
         for count, task in enumerate(self.tasks, start=1):
+            # Error properties take precedence over the task context
+            context = {"taskNumber": count, "taskPosition": count}
             for error in task.errors:
-                context = {"taskNumber": count, "taskPosition": count}
-                context.update(error)
-                result.append([context.get(prop) for prop in spec])
+                result.append([error.get(prop, context.get(prop)) for prop in spec])
         return result
 
     # Import/Export
@@ -323,9 +321,7 @@ class ReportTask(Metadata):
         """
         result = []
         for error in self.errors:
-            context = {}
-            context.update(error)
-            result.append([context.get(prop) for prop in spec])
+            result.append([error.get(prop) for prop in spec])
         return result
 
     # Metadata
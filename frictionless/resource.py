@@ -198,8 +198,6 @@ class Resource(Metadata):
         self.__text_stream = None
         self.__list_stream = None
         self.__row_stream = None
-        self.__row_number = None
-        self.__row_position = None
         self.__field_positions = None
         self.__fragment_positions = None
 
@@ -866,7 +864,12 @@ class Resource(Metadata):
             field_number += 1
             field_info["names"].append(field.name)
             field_info["objects"].append(field.to_copy())
-            field_info["mapping"][field.name] = (field, field_number, field_position)
+            field_info["mapping"][field.name] = (
+                field,
+                field_number,
+                field_position,
+                field.read_cell,
+            )
             if field_position is not None:
                 field_info["positions"].append(field_position)
 
@@ -896,26 +899,28 @@ class Resource(Metadata):
 
         # Create row stream
         def row_stream():
-            self.__row_number = 0
+            # Per-row state and settings are kept in locals to keep the loop tight
+            row_number = 0
             limit = self.layout.limit_rows
             offset = self.layout.offset_rows or 0
+            primary_key = self.schema.primary_key
+            onerror = self.onerror
             for row_position, cells in iterator:
-                self.__row_position = row_position
 
                 # Offset/offset rows
                 if offset:
                     offset -= 1
                     continue
-                if limit and limit <= self.__row_number:
+                if limit and limit <= row_number:
                     break
 
                 # Create row
-                self.__row_number += 1
+                row_number += 1
                 row = Row(
                     cells,
                     field_info=field_info,
-                    row_position=self.__row_position,
-                    row_number=self.__row_number,
+                    row_position=row_position,
+                    row_number=row_number,
                 )
 
                 # Unique Error
@@ -932,8 +937,8 @@ class Resource(Metadata):
                                 row.errors.append(error)
 
                 # Primary Key Error
-                if is_integrity and self.schema.primary_key:
-                    cells = tuple(row[name] for name in self.schema.primary_key)
+                if is_integrity and primary_key:
+                    cells = tuple(row[name] for name in primary_key)
                     if set(cells) == {None}:
                         note = 'cells composing the primary keys are all "None"'
                         error = errors.PrimaryKeyError.from_row(row, note=note)
@@ -962,10 +967,10 @@ class Resource(Metadata):
                                 row.errors.append(error)
 
                 # Handle errors
-                if self.onerror != "ignore":
+                if onerror != "ignore":
                     if not row.valid:
                         error = row.errors[0]
-                        if self.onerror == "raise":
+                        if onerror == "raise":
                             raise FrictionlessException(error)
                         warnings.warn(error.message, UserWarning)
 
@@ -973,7 +978,7 @@ class Resource(Metadata):
                 yield row
 
             # Update stats
-            self.stats["rows"] = self.__row_number
+            self.stats["rows"] = row_number
 
         # Return row stream
         return row_stream()
@@ -1014,11 +1019,19 @@ class Resource(Metadata):
             return
 
         # Stream with filtering
+        # We resolve filters in-advance to skip the ones not set in the layout
+        is_row_filtering = bool(self.layout.pick_rows or self.layout.skip_rows)
+        is_field_filtering = self.layout.is_field_filtering
+        field_positions = set(self.__field_positions)
         for row_position, cells in iterator:
-            if self.layout.read_filter_rows(cells, row_position=row_position):
-                yield row_position, self.layout.read_filter_cells(
-                    cells, field_positions=self.__field_positions
+            if is_row_filtering:
+                if not self.layout.read_filter_rows(cells, row_position=row_position):
+                    continue
+            if is_field_filtering:
+                cells = self.layout.read_filter_cells(
+                    cells, field_positions=field_positions
                 )
+            yield row_position, cells
 
     def __read_detect_layout(self):
         sample = self.__parser.sample
@@ -1,6 +1,5 @@
 from itertools import zip_longest
 from importlib import import_module
-from .helpers import cached_property
 from . import helpers
 from . import errors
 
@@ -65,7 +64,7 @@ class Row(dict):
 
     def __setitem__(self, key, value):
         try:
-            field, field_number, field_position = self.__field_info["mapping"][key]
+            field, field_number, *_ = self.__field_info["mapping"][key]
         except KeyError:
             raise KeyError(f"Row does not have a field {key}")
         if len(self.__cells) < field_number:
@@ -104,7 +103,7 @@ class Row(dict):
             return default
         return self[key]
 
-    @cached_property
+    @property
     def cells(self):
         """
         Returns:
@@ -112,7 +111,7 @@ class Row(dict):
         """
         return self.__cells
 
-    @cached_property
+    @property
     def fields(self):
         """
         Returns:
@@ -120,7 +119,7 @@ class Row(dict):
         """
         return self.__field_info["objects"]
 
-    @cached_property
+    @property
     def field_names(self):
         """
         Returns:
@@ -128,7 +127,7 @@ class Row(dict):
         """
         return self.__field_info["names"]
 
-    @cached_property
+    @property
     def field_positions(self):
         """
         Returns:
@@ -136,7 +135,7 @@ class Row(dict):
         """
         return self.__field_info["positions"]
 
-    @cached_property
+    @property
     def row_position(self):
         """
         Returns:
@@ -144,7 +143,7 @@ class Row(dict):
         """
         return self.__row_position
 
-    @cached_property
+    @property
     def row_number(self):
         """
         Returns:
@@ -152,7 +151,7 @@ class Row(dict):
         """
         return self.__row_number
 
-    @cached_property
+    @property
     def blank_cells(self):
         """A mapping indexed by a field name with blank cells before parsing
 
@@ -162,7 +161,7 @@ class Row(dict):
         self.__process()
         return self.__blank_cells
 
-    @cached_property
+    @property
     def error_cells(self):
         """A mapping indexed by a field name with error cells before parsing
 
@@ -172,7 +171,7 @@ class Row(dict):
         self.__process()
         return self.__error_cells
 
-    @cached_property
+    @property
     def errors(self):
         """
         Returns:
@@ -181,7 +180,7 @@ class Row(dict):
         self.__process()
         return self.__errors
 
-    @cached_property
+    @property
     def valid(self):
         """
         Returns:
@@ -213,19 +212,16 @@ class Row(dict):
 
         # Prepare
         self.__process()
-        plugin = import_module("frictionless.plugins.json")
         result = [self[name] for name in self.__field_info["names"]]
         if types is None and json:
-            types = plugin.JsonParser.supported_types
+            types = import_module("frictionless.plugins.json").JsonParser.supported_types
 
         # Convert
         if types is not None:
-            for index, field in enumerate(self.__field_info["objects"]):
-                # Here we can optimize performance if we use a types mapping
-                if field.type not in types:
-                    cell = result[index]
-                    cell, notes = field.write_cell(cell, ignore_missing=True)
-                    result[index] = cell
+            for index, field in self.__get_write_fields(types):
+                cell = result[index]
+                cell, notes = field.write_cell(cell, ignore_missing=True)
+                result[index] = cell
 
         # Return
         return result
@@ -241,25 +237,37 @@ class Row(dict):
 
         # Prepare
         self.__process()
-        plugin = import_module("frictionless.plugins.json")
         result = {name: self[name] for name in self.__field_info["names"]}
         if types is None and json:
-            types = plugin.JsonParser.supported_types
+            types = import_module("frictionless.plugins.json").JsonParser.supported_types
 
         # Covert
         if types is not None:
-            for index, field in enumerate(self.__field_info["objects"]):
-                # Here we can optimize performance if we use a types mapping
-                if field.type not in types:
-                    cell = result[field.name]
-                    cell, notes = field.write_cell(cell, ignore_missing=True)
-                    result[field.name] = cell
+            for index, field in self.__get_write_fields(types):
+                cell = result[field.name]
+                cell, notes = field.write_cell(cell, ignore_missing=True)
+                result[field.name] = cell
 
         # Return
         return result
 
     # Process
 
+    def __get_write_fields(self, types):
+        # NOTE:
+        # Fields requiring conversion for a types set are the same for all the rows
+        # so we resolve them once and cache them in the shared field info
+        cache = self.__field_info.setdefault("write_fields", {})
+        key = tuple(types)
+        write_fields = cache.get(key)
+        if write_fields is None:
+            write_fields = []
+            for index, field in enumerate(self.__field_info["objects"]):
+                if field.type not in types:
+                    write_fields.append((index, field))
+            cache[key] = write_fields
+        return write_fields
+
     def __process(self, key=None):
 
         # NOTE:
@@ -275,43 +283,51 @@ class Row(dict):
         fields = self.__field_info["objects"]
         field_mapping = self.__field_info["mapping"]
         field_positions = self.__field_info["positions"]
-        iterator = zip_longest(field_mapping.values(), cells)
+        # Extra cells are handled below so only missing cells require zip_longest
+        ragged = len(cells) < len(field_mapping)
+        iterator = (zip_longest if ragged else zip)(field_mapping.items(), cells)
         is_empty = not bool(super().__len__())
         if key:
             try:
-                field, field_number, field_position = self.__field_info["mapping"][key]
+                field_entry = self.__field_info["mapping"][key]
             except KeyError:
                 raise KeyError(f"Row does not have a field {key}")
+            _, field_number, *_ = field_entry
             cell = cells[field_number - 1] if len(cells) >= field_number else None
-            iterator = zip([(field, field_number, field_position)], [cell])
+            iterator = zip([(key, field_entry)], [cell])
+
+        # Prepare error context
+        # Stringified cells are created only if the row has errors
+        # and then they are shared between all the errors of the row
+        error_cells = None
 
         # Iterate cells
-        for field_mapping, source in iterator:
+        for field_item, source in iterator:
 
             # Prepare context
-            if field_mapping is None:
-                break
-            field, field_number, field_position = field_mapping
-            if not is_empty and not is_empty and super().__contains__(field.name):
+            # Field attributes and read_cell are bound in-advance in the field info
+            field_name, (_, field_number, field_position, read_cell) = field_item
+            if not is_empty and super().__contains__(field_name):
                 continue
 
             # Read cell
-            target, notes = field.read_cell(source)
+            target, notes = read_cell(source)
             type_note = notes.pop("type", None) if notes else None
             if target is None and not type_note:
-                self.__blank_cells[field.name] = source
+                self.__blank_cells[field_name] = source
 
             # Type error
             if type_note:
-                self.__error_cells[field.name] = source
+                error_cells = error_cells or list(map(str, cells))
+                self.__error_cells[field_name] = source
                 self.__errors.append(
                     errors.TypeError(
                         note=type_note,
-                        cells=list(map(str, cells)),
+                        cells=error_cells,
                         row_number=self.__row_number,
                         row_position=self.__row_position,
                         cell=str(source),
-                        field_name=field.name,
+                        field_name=field_name,
                         field_number=field_number,
                         field_position=field_position,
                     )
@@ -319,22 +335,23 @@ class Row(dict):
 
             # Constraint errors
             if notes:
+                error_cells = error_cells or list(map(str, cells))
                 for note in notes.values():
                     self.__errors.append(
                         errors.ConstraintError(
                             note=note,
-                            cells=list(map(str, cells)),
+                            cells=error_cells,
                             row_number=self.__row_number,
                             row_position=self.__row_position,
                             cell=str(source),
-                            field_name=field.name,
+                            field_name=field_name,
                             field_number=field_number,
                             field_position=field_position,
                         )
                     )
 
             # Set/return value
-            super().__setitem__(field.name, target)
+            super().__setitem__(field_name, target)
             if key:
                 return target
 
@@ -342,11 +359,12 @@ class Row(dict):
         if len(fields) < len(cells):
             iterator = cells[len(fields) :]
             start = max(field_positions[: len(fields)]) + 1
+            error_cells = error_cells or list(map(str, cells))
             for field_position, cell in enumerate(iterator, start=start):
                 self.__errors.append(
                     errors.ExtraCellError(
                         note="",
-                        cells=list(map(str, cells)),
+                        cells=error_cells,
                         row_number=self.__row_number,
                         row_position=self.__row_position,
                         cell=str(cell),
@@ -359,13 +377,14 @@ class Row(dict):
         # Missing cells
         if len(fields) > len(cells):
             start = len(cells) + 1
+            error_cells = error_cells or list(map(str, cells))
             iterator = zip_longest(field_positions[len(cells) :], fields[len(cells) :])
             for field_number, (field_position, field) in enumerate(iterator, start=start):
                 if field is not None:
                     self.__errors.append(
                         errors.MissingCellError(
                             note="",
-                            cells=list(map(str, cells)),
+                            cells=error_cells,
                             row_number=self.__row_number,
                             row_position=self.__row_position,
                             cell="",
@@ -378,10 +397,11 @@ class Row(dict):
 
         # Blank row
         if len(fields) == len(self.__blank_cells):
+            error_cells = error_cells or list(map(str, cells))
             self.__errors = [
                 errors.BlankRowError(
                     note="",
-                    cells=list(map(str, cells)),
+                    cells=error_cells,
                     row_number=self.__row_number,
                     row_position=self.__row_position,
                 )
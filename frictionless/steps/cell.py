@@ -1,11 +1,16 @@
-import petl
+import re
 from ..step import Step
+from ..metadata import Metadata
 
 
 # NOTE:
 # Some of the following step can support WHERE/PREDICAT arguments (see petl)
 # Currently, metadata profiles are not fully finished; will require improvements
 
+# NOTE:
+# Steps providing a `transform_cell_function` (a field-level conversion) can be
+# fused by transform_resource into a single pass over the data (see transform.resource)
+
 
 class cell_convert(Step):
     """Convert cell"""
@@ -29,10 +34,20 @@ class cell_convert(Step):
             if not function:
                 function = lambda input: value
             resource.data = table.convertall(function)
-        elif function:
-            resource.data = table.convert(field_name, function)
         else:
-            resource.data = table.update(field_name, value)
+            resource.data = table.convert(field_name, self.transform_cell_function)
+
+    @Metadata.property(write=False)
+    def transform_cell_function(self):
+        """Transform cell (function only)
+
+        Returns:
+            func?: cell conversion function if the step is field-level
+        """
+        if self.get("fieldName"):
+            function = self.get("function")
+            value = self.get("value")
+            return function if function else lambda cell: value
 
     # Metadata
 
@@ -109,7 +124,17 @@ class cell_format(Step):
         if not field_name:
             resource.data = table.formatall(template)
         else:
-            resource.data = table.format(field_name, template)
+            resource.data = table.convert(field_name, self.transform_cell_function)
+
+    @Metadata.property(write=False)
+    def transform_cell_function(self):
+        """Transform cell (function only)
+
+        Returns:
+            func?: cell conversion function if the step is field-level
+        """
+        if self.get("fieldName"):
+            return self.get("template").format
 
     # Metadata
 
@@ -142,7 +167,18 @@ class cell_interpolate(Step):
         if not field_name:
             resource.data = table.interpolateall(template)
         else:
-            resource.data = table.interpolate(field_name, template)
+            resource.data = table.convert(field_name, self.transform_cell_function)
+
+    @Metadata.property(write=False)
+    def transform_cell_function(self):
+        """Transform cell (function only)
+
+        Returns:
+            func?: cell conversion function if the step is field-level
+        """
+        if self.get("fieldName"):
+            template = self.get("template")
+            return lambda cell: template % cell
 
     # Metadata
 
@@ -177,12 +213,22 @@ class cell_replace(Step):
         if not field_name:
             resource.data = table.replaceall(pattern, replace)
         else:
-            pattern = pattern
-            function = petl.replace
+            resource.data = table.convert(field_name, self.transform_cell_function)
+
+    @Metadata.property(write=False)
+    def transform_cell_function(self):
+        """Transform cell (function only)
+
+        Returns:
+            func?: cell conversion function if the step is field-level
+        """
+        if self.get("fieldName"):
+            pattern = self.get("pattern")
+            replace = self.get("replace")
             if pattern.startswith("<regex>"):
-                pattern = pattern.replace("<regex>", "")
-                function = petl.sub
-            resource.data = function(table, field_name, pattern, replace)
+                regex = re.compile(pattern.replace("<regex>", ""))
+                return lambda cell: regex.sub(replace, cell)
+            return lambda cell: replace if cell == pattern else cell
 
     # Metadata
 
@@ -209,9 +255,19 @@ class cell_set(Step):
 
     def transform_resource(self, resource):
         table = resource.to_petl()
-        value = self.get("value")
         field_name = self.get("fieldName")
-        resource.data = table.update(field_name, value)
+        resource.data = table.convert(field_name, self.transform_cell_function)
+
+    @Metadata.property(write=False)
+    def transform_cell_function(self):
+        """Transform cell (function only)
+
+        Returns:
+            func?: cell conversion function if the step is field-level
+        """
+        if self.get("fieldName"):
+            value = self.get("value")
+            return lambda cell: value
 
     # Metadata
 
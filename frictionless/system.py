@@ -1,5 +1,6 @@
 import os
 import pkgutil
+import requests
 from collections import OrderedDict
 from importlib import import_module
 from .exception import FrictionlessException
@@ -8,6 +9,7 @@ from .control import Control
 from .dialect import Dialect
 from .file import File
 from . import errors
+from . import config
 
 
 # NOTE:
@@ -29,6 +31,8 @@ class System:
 
     def __init__(self):
         self.__dynamic_plugins = OrderedDict()
+        self.__http_session = None
+        self.__http_session_pid = None
 
     def register(self, name, plugin):
         """Register a plugin
@@ -260,6 +264,32 @@ class System:
         note = f'cannot create type "{code}". Try installing "frictionless-{code}"'
         raise FrictionlessException(errors.FieldError(note=note))
 
+    # Requests
+
+    def get_http_session(self):
+        """Get a shared HTTP session
+
+        The session is created on the first call and reused afterwards
+        so connections to the same host are kept alive and pooled.
+        A forked process gets its own session to not share sockets.
+
+        Returns:
+            requests.Session: HTTP session
+        """
+        pid = os.getpid()
+        if self.__http_session is None or self.__http_session_pid != pid:
+            session = requests.Session()
+            session.headers.update(config.DEFAULT_HTTP_HEADERS)
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=config.DEFAULT_HTTP_POOL_CONNECTIONS,
+                pool_maxsize=config.DEFAULT_HTTP_POOL_MAXSIZE,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self.__http_session = session
+            self.__http_session_pid = pid
+        return self.__http_session
+
     # Methods
 
     @cached_property
@@ -1,5 +1,8 @@
+import petl
 import types
+from functools import reduce
 from ..step import Step
+from ..metadata import Metadata
 from ..system import system
 from ..helpers import get_name
 from ..resource import Resource
@@ -42,6 +45,9 @@ def transform_resource(source=None, *, steps, **options):
         if step.metadata_errors:
             raise FrictionlessException(step.metadata_errors[0])
 
+    # Fuse steps
+    steps = fuse_cell_steps(steps)
+
     # Run transforms
     for step in steps:
         data = resource.data
@@ -50,6 +56,9 @@ def transform_resource(source=None, *, steps, **options):
         try:
             step.transform_resource(resource)
         except Exception as exception:
+            if isinstance(exception, FrictionlessException):
+                if exception.error.code == "step-error":
+                    raise
             error = errors.StepError(note=f'"{get_name(step)}" raises "{exception}"')
             raise FrictionlessException(error) from exception
 
@@ -76,6 +85,68 @@ def transform_resource(source=None, *, steps, **options):
 # Internal
 
 
+def fuse_cell_steps(steps):
+    fused_steps = []
+    for step in steps:
+        prev_step = fused_steps[-1] if fused_steps else None
+        if is_cell_step(step) and is_cell_step(prev_step):
+            if step.get("fieldName") == prev_step.get("fieldName"):
+                fused_steps[-1] = CellStepsFusion(prev_step, step)
+                continue
+        fused_steps.append(step)
+    return fused_steps
+
+
+def is_cell_step(step):
+    # The function is not built here so its errors are reported by the transform
+    if step is None or not step.get("fieldName"):
+        return False
+    return hasattr(type(step), "transform_cell_function")
+
+
+# NOTE:
+# Consecutive field-level cell steps are applied as one composed function
+# so the data is streamed through petl (and re-read by the resource) only once
+
+
+class CellStepsFusion(Step):
+    def __init__(self, *steps):
+        super().__init__({"fieldName": steps[0].get("fieldName")})
+        self.__steps = []
+        for step in steps:
+            if isinstance(step, CellStepsFusion):
+                self.__steps.extend(step.__steps)
+                continue
+            self.__steps.append(step)
+        # Data errors are reported under the name of the first step as unfused
+        self.__name__ = get_name(self.__steps[0])
+
+    def transform_resource(self, resource):
+        table = resource.to_petl()
+        resource.data = table.convert(self.get("fieldName"), self.transform_cell_function)
+
+    @Metadata.property(write=False)
+    def transform_cell_function(self):
+        functions = []
+        for step in self.__steps:
+            try:
+                functions.append(step.transform_cell_function)
+            except Exception as exception:
+                error = errors.StepError(note=f'"{get_name(step)}" raises "{exception}"')
+                raise FrictionlessException(error) from exception
+        return lambda cell: reduce(convert_cell, functions, cell)
+
+
+def convert_cell(cell, function):
+    # Every function fails into None as a separate petl convert would do
+    try:
+        return function(cell)
+    except Exception:
+        if petl.config.failonerror:
+            raise
+        return None
+
+
 class DataWithErrorHandling:
     def __init__(self, data, *, step):
         self.data = data
@@ -85,32 +85,41 @@ def validate_resource(
 
     # Validate checks
     if not errors:
-        for index, check in enumerate(checks.copy()):
+        broken_checks = set()
+        for index, check in enumerate(checks):
             if check.metadata_errors:
-                del checks[index]
+                broken_checks.add(index)
                 for error in check.metadata_errors:
                     errors.append(error)
+        for index in sorted(broken_checks, reverse=True):
+            del checks[index]
 
     # Validate resource
     if not errors:
         with resource:
 
             # Validate start
-            for index, check in enumerate(checks.copy()):
+            broken_checks = set()
+            for index, check in enumerate(checks):
                 check.connect(resource)
                 for error in check.validate_start():
                     if error.code == "check-error":
-                        del checks[index]
+                        broken_checks.add(index)
                     errors.append(error)
+            for index in sorted(broken_checks, reverse=True):
+                del checks[index]
 
             # Validate rows
             if resource.tabular:
+                # NOTE: bound methods are resolved in-advance to keep the row loop tight
+                validate_rows = [check.validate_row for check in checks]
+                append_error = errors.append
                 for row in resource.row_stream:
 
                     # Validate row
-                    for check in checks:
-                        for error in check.validate_row(row):
-                            errors.append(error)
+                    for validate_row in validate_rows:
+                        for error in validate_row(row):
+                            append_error(error)
 
                     # Limit errors
                     if limit_errors and len(errors) >= limit_errors:
@@ -33,6 +33,7 @@ TESTS_REQUIRE = [
     "pytest-cov",
     "pytest-vcr",
     "pytest-only",
+    "pytest-xdist",
     "oauth2client",
     "requests-mock",
     "python-dotenv",
@@ -66,6 +66,27 @@ def test_validate_forbidden_value_many_rules_with_non_existent_field():
     ]
 
 
+def test_validate_forbidden_value_many_rules_with_many_non_existent_fields():
+    source = [
+        ["row", "name"],
+        [2, "Alex"],
+        [3, "mistake"],
+    ]
+    report = validate(
+        source,
+        checks=[
+            {"code": "forbidden-value", "fieldName": "bad1", "values": [10]},
+            {"code": "forbidden-value", "fieldName": "bad2", "values": [10]},
+            {"code": "forbidden-value", "fieldName": "name", "values": ["mistake"]},
+        ],
+    )
+    assert report.flatten(["rowPosition", "fieldPosition", "code"]) == [
+        [None, None, "check-error"],
+        [None, None, "check-error"],
+        [3, 2, "forbidden-value"],
+    ]
+
+
 # Sequential Value
 
 
@@ -1,5 +1,8 @@
+import gzip
 import pytest
-from frictionless import Resource
+import requests
+from frictionless import Resource, system, config
+from frictionless.plugins.remote import RemoteControl, RemoteByteStream
 
 
 BASEURL = "https://raw.githubusercontent.com/frictionlessdata/frictionless-py/master/%s"
@@ -47,3 +50,63 @@ def test_remote_loader_write(requests_mock):
     source = Resource("data/table.csv")
     target = source.write(path)
     assert target
+
+
+def test_remote_loader_gzip_content_encoding_small_buffer(requests_mock):
+    path = "https://example.com/table.csv"
+    headers = {"Content-Encoding": "gzip"}
+    with open("data/table.csv", "rb") as file:
+        content = gzip.compress(file.read())
+    requests_mock.get(path, content=content, headers=headers)
+    control = RemoteControl(http_buffer_size=10)
+    with Resource(path, control=control) as resource:
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+        assert resource.stats == {
+            "hash": "6c2c61dd9b0e9c6876139a449ed87933",
+            "bytes": 30,
+            "fields": 2,
+            "rows": 2,
+        }
+
+
+def test_remote_byte_stream_keeps_decoded_bytes_beyond_requested_size(requests_mock):
+    # Older urllib3 versions can return more decoded bytes than requested
+    path = "https://example.com/table.csv"
+    requests_mock.get(path, content=b"id,name\n1,english\n")
+    session = requests.Session()
+    stream = RemoteByteStream(path, session=session, timeout=None).open()
+    read = stream.read
+    stream.read = lambda size=-1: read(-1 if size == -1 else size * 2)
+    buffer = bytearray(4)
+    chunks = []
+    size = stream.readinto(buffer)
+    while size:
+        assert size <= len(buffer)
+        chunks.append(bytes(buffer[:size]))
+        size = stream.readinto(buffer)
+    assert b"".join(chunks) == b"id,name\n1,english\n"
+
+
+# Control
+
+
+def test_remote_control_http_session_shared():
+    control1 = RemoteControl()
+    control2 = RemoteControl()
+    assert control1.http_session is control2.http_session
+    assert control1.http_session is system.get_http_session()
+
+
+def test_remote_control_http_session_custom():
+    session = requests.Session()
+    control = RemoteControl(http_session=session)
+    assert control.http_session is session
+
+
+def test_remote_control_http_buffer_size():
+    control = RemoteControl(http_buffer_size=1024)
+    assert control.http_buffer_size == 1024
+    assert RemoteControl().http_buffer_size == config.DEFAULT_HTTP_BUFFER_SIZE
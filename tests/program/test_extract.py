@@ -158,6 +158,18 @@ def test_program_extract_json():
     assert json.loads(result.stdout) == extract("data/table.csv")
 
 
+def test_program_extract_json_package():
+    result = runner.invoke(program, "extract data/package.json --json")
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == extract("data/package.json")
+
+
+def test_program_extract_json_error_not_found():
+    result = runner.invoke(program, "extract data/bad.csv --json")
+    assert result.exit_code == 1
+    assert result.stdout.count("No such file or directory: 'data/bad.csv'")
+
+
 def test_program_extract_csv():
     result = runner.invoke(program, "extract data/table.csv --csv")
     assert result.exit_code == 0
@@ -1,4 +1,6 @@
-from frictionless import Resource, transform, steps
+import pytest
+from frictionless import Resource, FrictionlessException, transform, steps
+from frictionless.transform.resource import fuse_cell_steps, CellStepsFusion
 
 
 # Convert
@@ -342,3 +344,110 @@ def test_step_cell_set():
         {"id": 2, "name": "france", "population": 100},
         {"id": 3, "name": "spain", "population": 100},
     ]
+
+
+# Fusion
+
+
+def test_step_cell_steps_fused_for_the_same_field():
+    source = Resource(path="data/transform.csv")
+    target = transform(
+        source,
+        steps=[
+            steps.cell_replace(pattern="<regex>^f", replace="F", field_name="name"),
+            steps.cell_format(template="{0}!", field_name="name"),
+            steps.cell_interpolate(template="<%s>", field_name="name"),
+            steps.cell_convert(value="n/a", field_name="id"),
+        ],
+    )
+    assert target.schema == {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "name", "type": "string"},
+            {"name": "population", "type": "integer"},
+        ]
+    }
+    assert target.read_rows() == [
+        {"id": None, "name": "<germany!>", "population": 83},
+        {"id": None, "name": "<France!>", "population": 66},
+        {"id": None, "name": "<spain!>", "population": 47},
+    ]
+
+
+def test_step_cell_steps_fusion():
+    source = [
+        steps.cell_replace(pattern="<regex>^f", replace="F", field_name="name"),
+        steps.cell_format(template="{0}!", field_name="name"),
+        steps.cell_interpolate(template="<%s>", field_name="name"),
+        steps.cell_convert(value="n/a", field_name="id"),
+        steps.cell_set(value=1, field_name="population"),
+        steps.cell_format(template="{0}!"),
+        steps.cell_fill(field_name="population", value=0),
+    ]
+    fused = fuse_cell_steps(source)
+    assert len(fused) == 5
+    assert isinstance(fused[0], CellStepsFusion)
+    assert fused[0].get("fieldName") == "name"
+    assert fused[0].transform_cell_function("france") == "<France!>"
+    assert all(step is original for step, original in zip(fused[1:], source[3:]))
+
+
+def test_step_cell_steps_fused_conversion_error_is_none():
+    source = Resource(path="data/transform.csv")
+    target = transform(
+        source,
+        steps=[
+            steps.cell_convert(function=lambda cell: 1 / 0, field_name="name"),
+            steps.cell_set(value="x", field_name="name"),
+        ],
+    )
+    assert target.read_rows() == [
+        {"id": 1, "name": "x", "population": 83},
+        {"id": 2, "name": "x", "population": 66},
+        {"id": 3, "name": "x", "population": 47},
+    ]
+
+
+def test_step_cell_steps_fused_error_names_the_step():
+    source = Resource(path="data/transform.csv")
+    with pytest.raises(FrictionlessException) as excinfo:
+        target = transform(
+            source,
+            steps=[
+                steps.cell_set(value="x", field_name="bad"),
+                steps.cell_format(template="{0}!", field_name="bad"),
+            ],
+        )
+        target.read_rows()
+    error = excinfo.value.error
+    assert error.code == "step-error"
+    assert error.note.count('"cell_set" raises')
+
+
+def test_step_cell_replace_invalid_regex():
+    source = Resource(path="data/transform.csv")
+    with pytest.raises(FrictionlessException) as excinfo:
+        transform(
+            source,
+            steps=[
+                steps.cell_replace(pattern="<regex>(", replace="x", field_name="name"),
+            ],
+        )
+    error = excinfo.value.error
+    assert error.code == "step-error"
+    assert error.note.count('"cell_replace" raises')
+
+
+def test_step_cell_replace_invalid_regex_fused():
+    source = Resource(path="data/transform.csv")
+    with pytest.raises(FrictionlessException) as excinfo:
+        transform(
+            source,
+            steps=[
+                steps.cell_format(template="{0}!", field_name="name"),
+                steps.cell_replace(pattern="<regex>(", replace="x", field_name="name"),
+            ],
+        )
+    error = excinfo.value.error
+    assert error.code == "step-error"
+    assert error.note.count('"cell_replace" raises')
@@ -31,3 +31,14 @@ def test_missing_label():
         assert header == ["id", "name", "extra"]
         assert header.labels == ["id", "name"]
         assert header.valid is False
+
+
+def test_duplicate_labels():
+    source = [["id", "name", "id", "value", "id"], [1, 2, 3, 4, 5]]
+    with Resource(source) as resource:
+        header = resource.header
+        assert header.valid is False
+        assert [(error.code, error.note) for error in header.errors] == [
+            ("duplicate-label", 'at position "1"'),
+            ("duplicate-label", 'at position "1, 3"'),
+        ]
@@ -1,4 +1,5 @@
 import json
+import pytest
 from decimal import Decimal
 from frictionless import Resource, extract
 
@@ -38,24 +39,17 @@ def test_to_str_with_doublequotes():
     assert rows[1].to_str() == '2,"german,GE"'
 
 
-def test_to_dict_with_json_null_values_issue_519():
+@pytest.mark.parametrize(
+    "method, target",
+    [
+        ("to_dict", [{"value": "2020-01-01"}, {"value": None}, {"value": "2020-03-03"}]),
+        ("to_list", [["2020-01-01"], [None], ["2020-03-03"]]),
+    ],
+)
+def test_to_json_with_null_values_issue_519(method, target):
     source = b"value\n2020-01-01\n\n2020-03-03"
-    process = lambda row: row.to_dict(json=True)
-    extract(source, format="csv", process=process) == [
-        {"value": "2020-01-01"},
-        {"value": None},
-        {"value": "2020-03-03"},
-    ]
-
-
-def test_to_list_with_json_null_values_issue_519():
-    source = b"value\n2020-01-01\n\n2020-03-03"
-    process = lambda row: row.to_list(json=True)
-    extract(source, format="csv", process=process) == [
-        ["2020-01-01"],
-        [None],
-        ["2020-03-03"],
-    ]
+    process = lambda row: getattr(row, method)(json=True)
+    assert extract(source, format="csv", process=process) == target
 
 
 def test_decimal_to_json():